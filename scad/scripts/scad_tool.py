@@ -1,49 +1,59 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.10"
-# dependencies = []
+# dependencies = ["numpy"]
 # ///
 """OpenSCAD helper: validate, render STL, and take screenshots.
 
 Mac-only version with preset screenshot modes and custom angle support.
 """
 import argparse
+import hashlib
+import json
 import math
 import os
+import re
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # optional; scalar fallbacks are used without it
+    np = None
+
 SCAD_HOME = Path(os.environ.get("SCAD_HOME", "~/.scad")).expanduser()
 OPENSCAD_BIN = "/Applications/OpenSCAD.app/Contents/MacOS/OpenSCAD"
+QUIET = bool(os.environ.get("SCAD_QUIET"))
 
 # Preset screenshot configurations (from scad-1)
 PRESETS = {
-    "single": [("iso", "0,0,0,55,0,25,0")],
+    "single": [("iso", "--camera=0,0,0,55,0,25,0")],
     "iso": [
-        ("iso_ne", "0,0,0,55,0,45,0"),
-        ("iso_nw", "0,0,0,55,0,135,0"),
-        ("iso_sw", "0,0,0,55,0,225,0"),
-        ("iso_se", "0,0,0,55,0,315,0"),
+        ("iso_ne", "--camera=0,0,0,55,0,45,0"),
+        ("iso_nw", "--camera=0,0,0,55,0,135,0"),
+        ("iso_sw", "--camera=0,0,0,55,0,225,0"),
+        ("iso_se", "--camera=0,0,0,55,0,315,0"),
     ],
     "ortho": [
-        ("front", "0,0,0,90,0,0,0"),
-        ("back", "0,0,0,90,0,180,0"),
-        ("left", "0,0,0,90,0,270,0"),
-        ("right", "0,0,0,90,0,90,0"),
-        ("top", "0,0,0,0,0,0,0"),
-        ("bottom", "0,0,0,180,0,0,0"),
+        ("front", "--camera=0,0,0,90,0,0,0"),
+        ("back", "--camera=0,0,0,90,0,180,0"),
+        ("left", "--camera=0,0,0,90,0,270,0"),
+        ("right", "--camera=0,0,0,90,0,90,0"),
+        ("top", "--camera=0,0,0,0,0,0,0"),
+        ("bottom", "--camera=0,0,0,180,0,0,0"),
     ],
     "standard": [
-        ("front", "0,0,0,90,0,0,0"),
-        ("back", "0,0,0,90,0,180,0"),
-        ("left", "0,0,0,90,0,270,0"),
-        ("right", "0,0,0,90,0,90,0"),
-        ("top", "0,0,0,0,0,0,0"),
-        ("bottom", "0,0,0,180,0,0,0"),
-        ("iso", "0,0,0,55,0,25,0"),
+        ("front", "--camera=0,0,0,90,0,0,0"),
+        ("back", "--camera=0,0,0,90,0,180,0"),
+        ("left", "--camera=0,0,0,90,0,270,0"),
+        ("right", "--camera=0,0,0,90,0,90,0"),
+        ("top", "--camera=0,0,0,0,0,0,0"),
+        ("bottom", "--camera=0,0,0,180,0,0,0"),
+        ("iso", "--camera=0,0,0,55,0,25,0"),
     ],
 }
 
@@ -83,21 +93,171 @@ def detect_flags(help_text):
     flags = [
         "--render", "--backend", "--camera", "--imgsize",
         "--viewall", "--autocenter", "--projection",
-        "--view", "--colorscheme",
+        "--view", "--colorscheme", "--animate",
+        "--export-format",
     ]
     return {flag: (flag in help_text) for flag in flags}
 
 
-def run(cmd, env=None):
+# Flag support for released OpenSCAD versions, keyed by the string
+# reported by --version. The --version probe is much cheaper than the
+# --help scan; versions not listed here fall back to the help text.
+KNOWN_VERSIONS = {
+    "2021.01": {
+        "--render": True, "--backend": False, "--camera": True,
+        "--imgsize": True, "--viewall": True, "--autocenter": True,
+        "--projection": True, "--view": True, "--colorscheme": True,
+        "--animate": True, "--export-format": True,
+    },
+    "2025.07": {
+        "--render": True, "--backend": True, "--camera": True,
+        "--imgsize": True, "--viewall": True, "--autocenter": True,
+        "--projection": True, "--view": True, "--colorscheme": True,
+        "--animate": True, "--export-format": True,
+    },
+}
+
+_VERSION_RE = re.compile(r"OpenSCAD version (\S+)")
+
+
+def detect_flags_fast(openscad):
+    """Look up flag support by OpenSCAD version; None on unknown versions."""
+    text = _openscad_version(openscad).decode(errors="replace")
+    match = _VERSION_RE.search(text)
+    if not match:
+        return None
+    return KNOWN_VERSIONS.get(match.group(1))
+
+
+_INCLUDE_RE = re.compile(r"^\s*(?:include|use)\s*<([^>]+)>", re.MULTILINE)
+
+
+def _scad_deps(scad_file, seen=None):
+    """Collect transitive include<>/use<> dependencies of a SCAD file."""
+    if seen is None:
+        seen = set()
+    deps = []
+    try:
+        text = scad_file.read_text(errors="replace")
+    except OSError:
+        return deps
+    for name in _INCLUDE_RE.findall(text):
+        for base in (scad_file.parent, SCAD_HOME):
+            dep = (base / name).resolve()
+            if dep.is_file():
+                if dep not in seen:
+                    seen.add(dep)
+                    deps.append(dep)
+                    deps.extend(_scad_deps(dep, seen))
+                break
+    return deps
+
+
+def _openscad_version(openscad):
+    """Get OpenSCAD version output (raw bytes)."""
+    try:
+        res = subprocess.run([openscad, "--version"], capture_output=True)
+        return (res.stdout or b"") + (res.stderr or b"")
+    except Exception:
+        return b""
+
+
+def _cache_key(scad_file, defines, openscad):
+    """Hash SCAD contents, deps, defines and OpenSCAD version."""
+    h = hashlib.sha256()
+    h.update(scad_file.read_bytes())
+    for dep in _scad_deps(scad_file):
+        h.update(dep.read_bytes())
+    for d in sorted(defines):
+        h.update(d.encode())
+    h.update(_openscad_version(openscad))
+    return h.hexdigest()
+
+
+def _stl_cache_path(scad_file, defines, openscad):
+    """Path of the cached STL for this input, or None if hashing failed."""
+    try:
+        key = _cache_key(scad_file, defines, openscad)
+    except OSError:
+        return None
+    return SCAD_HOME / "cache" / f"{key}.stl"
+
+
+def _cache_dir_ready(cache):
+    """True if the cache entry's directory exists or could be created."""
+    if cache is None:
+        return False
+    try:
+        ensure_dir(cache.parent)
+    except OSError:
+        return False
+    return True
+
+
+def _load_supports_cached(openscad):
+    """Detect supported flags, memoized on disk keyed by the binary."""
+    st = os.stat(openscad)
+    key = f"{openscad}:{st.st_mtime_ns}:{st.st_size}"
+    cache_path = SCAD_HOME / ".flagcache.json"
+
+    try:
+        cached = json.loads(cache_path.read_text())
+        if key in cached:
+            return cached[key]
+    except (OSError, ValueError):
+        pass
+
+    supports = detect_flags_fast(openscad)
+    if supports is None:
+        supports = detect_flags(load_help_text(openscad))
+    try:
+        ensure_dir(SCAD_HOME)
+        cache_path.write_text(json.dumps({key: supports}))
+    except OSError:
+        pass
+    return supports
+
+
+def _echo(cmd):
+    """Echo a command unless quiet mode is on."""
+    if not QUIET:
+        print("+", shlex.join(cmd))
+
+
+# CPython only takes the posix_spawn fast path when it does not have to
+# close inherited fds, so render spawns pass close_fds=False — avoiding a
+# fork() that copies the interpreter's page tables for every OpenSCAD
+# child. Set SCAD_TOOL_SPAWN=fork to restore the default behavior.
+_CLOSE_FDS = os.environ.get("SCAD_TOOL_SPAWN") == "fork"
+
+
+def run(cmd, env=None, stdout=None):
     """Execute command and print it."""
-    print("+ " + " ".join(shlex.quote(c) for c in cmd))
-    result = subprocess.run(cmd, env=env)
+    _echo(cmd)
+    result = subprocess.run(cmd, env=env, stdout=stdout, close_fds=_CLOSE_FDS)
     if result.returncode != 0:
         sys.exit(result.returncode)
 
 
+_SCAD_ENV = None
+
+
+def run_exec(cmd, env=None):
+    """Print the command, then replace this process with it.
+
+    Saves keeping a Python interpreter resident for the duration of the
+    render; anything after this call never runs.
+    """
+    _echo(cmd)
+    sys.stdout.flush()
+    os.execvpe(cmd[0], cmd, env if env is not None else os.environ)
+
+
 def get_scad_env():
-    """Get environment with OPENSCADPATH set."""
+    """Get environment with OPENSCADPATH set (computed once per process)."""
+    global _SCAD_ENV
+    if _SCAD_ENV is not None:
+        return _SCAD_ENV
     env = os.environ.copy()
     scad_path = str(SCAD_HOME)
     if env.get("OPENSCADPATH"):
@@ -107,6 +267,7 @@ def get_scad_env():
         env["OPENSCADPATH"] = os.pathsep.join(parts)
     else:
         env["OPENSCADPATH"] = scad_path
+    _SCAD_ENV = env
     return env
 
 
@@ -131,12 +292,12 @@ def ensure_dir(path):
 
 
 def camera_string(direction, distance):
-    """Build camera string from direction vector and distance."""
+    """Build a --camera argv element from direction vector and distance."""
     dx, dy, dz = direction
     eye = (dx * distance, dy * distance, dz * distance)
     center = (0.0, 0.0, 0.0)
     vals = [*eye, *center]
-    return ",".join(f"{v:.3f}" for v in vals)
+    return "--camera=" + ",".join(f"{v:.3f}" for v in vals)
 
 
 def direction_from_angles(az_deg, el_deg):
@@ -176,16 +337,11 @@ def parse_angles(value):
 def cmd_validate(args, openscad, supports):
     """Validate SCAD file by attempting a render."""
     scad_file = ensure_scad_file(args.input)
-    out_dir = Path(args.out_dir or SCAD_HOME / "tmp").expanduser()
-    ensure_dir(out_dir)
 
-    with tempfile.NamedTemporaryFile(
-        prefix=f"{scad_file.stem}_validate_",
-        suffix=".stl",
-        dir=out_dir,
-        delete=False
-    ) as tmp:
-        tmp_path = Path(tmp.name)
+    cache = _stl_cache_path(scad_file, args.define, openscad)
+    if cache and cache.exists() and not args.keep:
+        print("Validation succeeded (cached)")
+        return
 
     cmd = [openscad]
     if supports.get("--render"):
@@ -193,13 +349,57 @@ def cmd_validate(args, openscad, supports):
     if supports.get("--backend"):
         cmd.extend(["--backend", "Manifold"])
     add_defines(cmd, args.define)
-    cmd.extend(["-o", str(tmp_path), str(scad_file)])
-
-    run(cmd, get_scad_env())
 
     if args.keep:
+        out_dir = Path(args.out_dir or SCAD_HOME / "tmp").expanduser()
+        ensure_dir(out_dir)
+        with tempfile.NamedTemporaryFile(
+            prefix=f"{scad_file.stem}_validate_",
+            suffix=".stl",
+            dir=out_dir,
+            delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+        cmd.extend(["-o", str(tmp_path), str(scad_file)])
+        run(cmd, get_scad_env())
+        if cache:
+            try:
+                ensure_dir(cache.parent)
+                shutil.copy(tmp_path, cache)
+            except OSError:
+                pass
         print(f"Validation output kept at {tmp_path}")
+    elif _cache_dir_ready(cache):
+        # Render straight into the cache so the bytes serve future hits;
+        # write to a .tmp sibling first so a failed render never leaves a
+        # partial file behind as a valid-looking cache entry.
+        tmp_path = cache.with_name(cache.name + ".tmp")
+        cmd.extend(["-o", str(tmp_path), str(scad_file)])
+        run(cmd, get_scad_env())
+        try:
+            tmp_path.rename(cache)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+        print("Validation succeeded")
+    elif supports.get("--export-format"):
+        # Cache unavailable (e.g. read-only SCAD_HOME): stream the STL to
+        # /dev/null instead of writing and unlinking a temp file.
+        cmd.extend(["-o", "/dev/stdout", "--export-format", "binstl",
+                    str(scad_file)])
+        run(cmd, get_scad_env(), stdout=subprocess.DEVNULL)
+        print("Validation succeeded")
     else:
+        out_dir = Path(args.out_dir or SCAD_HOME / "tmp").expanduser()
+        ensure_dir(out_dir)
+        with tempfile.NamedTemporaryFile(
+            prefix=f"{scad_file.stem}_validate_",
+            suffix=".stl",
+            dir=out_dir,
+            delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+        cmd.extend(["-o", str(tmp_path), str(scad_file)])
+        run(cmd, get_scad_env())
         tmp_path.unlink(missing_ok=True)
         print("Validation succeeded")
 
@@ -210,6 +410,12 @@ def cmd_stl(args, openscad, supports):
     out_path = Path(args.output or SCAD_HOME / "outputs" / f"{scad_file.stem}.stl").expanduser()
     ensure_dir(out_path.parent)
 
+    cache = _stl_cache_path(scad_file, args.define, openscad)
+    if cache and cache.exists():
+        shutil.copy(cache, out_path)
+        print(f"STL saved (cached): {out_path} ({out_path.stat().st_size:,} bytes)")
+        return
+
     cmd = [openscad]
     if supports.get("--render"):
         cmd.append("--render")
@@ -218,22 +424,195 @@ def cmd_stl(args, openscad, supports):
     add_defines(cmd, args.define)
     cmd.extend(["-o", str(out_path), str(scad_file)])
 
+    if args.exec:
+        run_exec(cmd, get_scad_env())
+
     run(cmd, get_scad_env())
+
+    if cache:
+        try:
+            ensure_dir(cache.parent)
+            shutil.copy(out_path, cache)
+        except OSError:
+            pass
+
     print(f"STL saved: {out_path} ({out_path.stat().st_size:,} bytes)")
 
 
+def _camera_to_vp(camera, default_distance):
+    """Convert a --camera argv element to ($vpt, $vpr, $vpd) settings."""
+    vals = [float(v) for v in camera.removeprefix("--camera=").split(",")]
+    if len(vals) == 7:
+        # translate_x,y,z,rot_x,y,z,dist form
+        vpt, vpr, vpd = vals[0:3], vals[3:6], vals[6]
+    else:
+        # eye_x,y,z,center_x,y,z form
+        eye, center = vals[0:3], vals[3:6]
+        dx, dy, dz = (e - c for e, c in zip(eye, center))
+        vpd = math.sqrt(dx * dx + dy * dy + dz * dz)
+        el = math.degrees(math.asin(dz / vpd)) if vpd else 0.0
+        az = math.degrees(math.atan2(dy, dx))
+        vpt, vpr = center, [90.0 - el, 0.0, 90.0 + az]
+    if not vpd:
+        vpd = default_distance
+    return vpt, vpr, vpd
+
+
+def _run_animate(wrapper_body, shots, scad_file, out_dir, supports, args,
+                 openscad, env):
+    """Render len(shots) frames from a $t-driven wrapper in one process.
+
+    Writes the wrapper, invokes OpenSCAD with --animate, and renames the
+    numbered frames to the labeled filenames. Returns False if the run
+    failed or produced an unexpected frame count, in which case the
+    caller falls back to per-view renders.
+    """
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp:
+        tmp_dir = Path(tmp)
+        wrapper = tmp_dir / f"{scad_file.stem}_views.scad"
+        wrapper.write_text(wrapper_body)
+
+        cmd = [openscad]
+        if supports.get("--render"):
+            cmd.append("--render")
+        if supports.get("--backend"):
+            cmd.extend(["--backend", "Manifold"])
+        add_defines(cmd, args.define)
+        # Same framing flags as the per-view path: the wrapper's $vpr/$vpt
+        # set the direction, while autocenter/viewall re-fit translation
+        # and distance to the model each frame.
+        if supports.get("--autocenter"):
+            cmd.append("--autocenter")
+        if supports.get("--viewall"):
+            cmd.append("--viewall")
+        if supports.get("--imgsize"):
+            cmd.append(f"--imgsize={args.width},{args.height}")
+        if supports.get("--colorscheme"):
+            cmd.append(f"--colorscheme={args.colorscheme or 'Cornfield'}")
+        if supports.get("--projection"):
+            cmd.append(f"--projection={args.projection or 'p'}")
+        if args.view_opts and supports.get("--view"):
+            cmd.append(f"--view={args.view_opts}")
+        cmd.extend(["--animate", str(len(shots)),
+                    "-o", str(tmp_dir / "frame.png"), str(wrapper)])
+
+        _echo(cmd)
+        result = subprocess.run(cmd, env=env, close_fds=_CLOSE_FDS)
+        if result.returncode != 0:
+            return False
+
+        frames = sorted(tmp_dir.glob("frame*.png"))
+        if len(frames) != len(shots):
+            return False
+        msgs = []
+        for frame, (label, _) in zip(frames, shots):
+            out_file = out_dir / f"{scad_file.stem}_{label}.png"
+            frame.rename(out_file)
+            msgs.append(f"  Captured: {label}")
+            msgs.append(f"    -> {out_file}")
+        print("\n".join(msgs))
+    return True
+
+
+def _screenshots_animated(shots, scad_file, out_dir, supports, args, openscad, env):
+    """Render all views in a single OpenSCAD run via --animate.
+
+    A temp wrapper includes the model once and drives the camera from $t,
+    so geometry is parsed and evaluated once instead of per view.
+    """
+    vps = [_camera_to_vp(camera, args.distance) for _, camera in shots]
+    rows = ",\n".join(
+        f"  [[{t[0]:.3f}, {t[1]:.3f}, {t[2]:.3f}],"
+        f" [{r[0]:.3f}, {r[1]:.3f}, {r[2]:.3f}], {d:.3f}]"
+        for t, r, d in vps
+    )
+    body = (
+        f"include <{scad_file.resolve()}>\n"
+        f"_vps = [\n{rows}\n];\n"
+        # $t = i/N, and (i/N)*N can land just below i in double math, so
+        # floor() would pick the previous camera; round() recovers i exactly.
+        "_i = min(len(_vps) - 1, round($t * len(_vps)));\n"
+        "$vpt = _vps[_i][0];\n"
+        "$vpr = _vps[_i][1];\n"
+        "$vpd = _vps[_i][2];\n"
+    )
+    return _run_animate(body, shots, scad_file, out_dir, supports, args,
+                        openscad, env)
+
+
+def _turntable_animated(shots, step, scad_file, out_dir, supports, args,
+                        openscad, env):
+    """Render a turntable sweep in a single OpenSCAD run via --animate.
+
+    The azimuth is a linear function of $t, so no camera table is needed:
+    frame i gets azimuth az_start + i * step.
+    """
+    body = (
+        f"include <{scad_file.resolve()}>\n"
+        "$vpt = [0, 0, 0];\n"
+        f"$vpr = [{90.0 - args.elevation:.3f}, 0,"
+        f" 90 + {args.az_start:.3f} + $t * {len(shots) * step:.3f}];\n"
+        f"$vpd = {args.distance:.3f};\n"
+    )
+    return _run_animate(body, shots, scad_file, out_dir, supports, args,
+                        openscad, env)
+
+
+def _compile_csg(scad_file, out_dir, args, openscad, env):
+    """Flatten the model to .csg once so per-view renders skip evaluation.
+
+    Returns the .csg path, or None if the conversion failed (callers then
+    render from the original source).
+    """
+    csg_path = out_dir / f".{scad_file.stem}.csg"
+    cmd = [openscad]
+    add_defines(cmd, args.define)
+    cmd.extend(["-o", str(csg_path), str(scad_file)])
+    _echo(cmd)
+    result = subprocess.run(cmd, env=env, close_fds=_CLOSE_FDS)
+    if result.returncode != 0:
+        csg_path.unlink(missing_ok=True)
+        return None
+    return csg_path
+
+
+def _screenshot_cmd_base(args, openscad, supports, include_defines=True):
+    """Build the argv prefix shared by every screenshot render."""
+    base = [openscad]
+    if supports.get("--render"):
+        base.append("--render")
+    if supports.get("--backend"):
+        base.extend(["--backend", "Manifold"])
+    if include_defines:
+        add_defines(base, args.define)
+    if supports.get("--autocenter"):
+        base.append("--autocenter")
+    if supports.get("--viewall"):
+        base.append("--viewall")
+    if supports.get("--imgsize"):
+        base.append(f"--imgsize={args.width},{args.height}")
+    if supports.get("--colorscheme"):
+        base.append(f"--colorscheme={args.colorscheme or 'Cornfield'}")
+    if supports.get("--projection"):
+        base.append(f"--projection={args.projection or 'p'}")
+    if args.view_opts and supports.get("--view"):
+        base.append(f"--view={args.view_opts}")
+    return base
+
+
+
+
 def cmd_screenshots(args, openscad, supports):
     """Take screenshots with preset modes, custom angles, or turntable."""
     scad_file = ensure_scad_file(args.input)
     out_dir = Path(args.out_dir or SCAD_HOME / "renders" / scad_file.stem).expanduser()
     ensure_dir(out_dir)
 
-    width = args.width
-    height = args.height
-    colorscheme = args.colorscheme or "Cornfield"
-    projection = args.projection or "p"
-
     shots = []
+    # Set only when the turntable branch builds the shots; the animate
+    # dispatch keys on it rather than on args.turntable, which a
+    # higher-priority mode like --angles may have overridden.
+    turntable_step = None
 
     # Priority 1: Custom angles (az:el pairs)
     if args.angles:
@@ -248,11 +627,38 @@ def cmd_screenshots(args, openscad, supports):
         if step == 0:
             step = 1
         count = max(1, int(360 / step))
-        for i in range(count):
-            az = args.az_start + i * step
-            label = f"tt_az{label_from_value(az)}_el{label_from_value(args.elevation)}"
-            direction = direction_from_angles(az, args.elevation)
-            shots.append((label, camera_string(direction, args.distance)))
+        turntable_step = step
+        if np is not None and count >= 16:
+            # One vectorized pass over all azimuths instead of per-frame
+            # math.* calls.
+            azimuths = args.az_start + np.arange(count) * step
+            az_rad = np.radians(azimuths)
+            el_rad = math.radians(args.elevation)
+            eyes = np.stack([
+                np.cos(el_rad) * np.cos(az_rad),
+                np.cos(el_rad) * np.sin(az_rad),
+                np.full(count, math.sin(el_rad)),
+            ], axis=1) * args.distance
+            for az, eye in zip(azimuths, eyes):
+                label = f"tt_az{label_from_value(float(az))}_el{label_from_value(args.elevation)}"
+                camera = "--camera=" + ",".join(f"{v:.3f}" for v in (*eye, 0.0, 0.0, 0.0))
+                shots.append((label, camera))
+        else:
+            # Elevation is constant across the sweep: hoist its trig (and
+            # the z component) out of the loop; only the azimuth varies.
+            el_rad = math.radians(args.elevation)
+            cel, sel = math.cos(el_rad), math.sin(el_rad)
+            dist = args.distance
+            el_label = label_from_value(args.elevation)
+            dz = sel * dist
+            for i in range(count):
+                az = args.az_start + i * step
+                az_rad = math.radians(az)
+                dx = cel * math.cos(az_rad) * dist
+                dy = cel * math.sin(az_rad) * dist
+                label = f"tt_az{label_from_value(az)}_el{el_label}"
+                camera = f"--camera={dx:.3f},{dy:.3f},{dz:.3f},0.000,0.000,0.000"
+                shots.append((label, camera))
 
     # Priority 3: Named views (iso, front, top, etc.)
     elif args.views:
@@ -284,36 +690,74 @@ def cmd_screenshots(args, openscad, supports):
     print(f"Output directory: {out_dir}")
     print()
 
+    scad_env = get_scad_env()
+
+    if len(shots) > 1 and supports.get("--animate"):
+        if turntable_step is not None:
+            ok = _turntable_animated(shots, turntable_step, scad_file, out_dir,
+                                     supports, args, openscad, scad_env)
+        else:
+            ok = _screenshots_animated(shots, scad_file, out_dir, supports,
+                                       args, openscad, scad_env)
+        if ok:
+            print()
+            print("Screenshots complete!")
+            return
+        print("Batched render unavailable, falling back to per-view renders")
+
+    jobs = max(1, min(args.jobs or 1, len(shots)))
+
+    # For multi-view renders, flatten the model once: the .csg re-parses
+    # cheaply, so each view skips file-level evaluation and include
+    # resolution.
+    render_input = scad_file
+    csg_path = None
+    if len(shots) > 1:
+        csg_path = _compile_csg(scad_file, out_dir, args, openscad, scad_env)
+        if csg_path:
+            render_input = csg_path
+
+    # Defines are already baked into the .csg.
+    base = _screenshot_cmd_base(args, openscad, supports,
+                                include_defines=csg_path is None)
+
+    cmds = []
     for label, camera in shots:
         out_file = out_dir / f"{scad_file.stem}_{label}.png"
-
-        cmd = [openscad]
-        if supports.get("--render"):
-            cmd.append("--render")
-        if supports.get("--backend"):
-            cmd.extend(["--backend", "Manifold"])
-        add_defines(cmd, args.define)
-
-        if supports.get("--autocenter"):
-            cmd.append("--autocenter")
-        if supports.get("--viewall"):
-            cmd.append("--viewall")
-        if supports.get("--camera"):
-            cmd.append(f"--camera={camera}")
-        if supports.get("--imgsize"):
-            cmd.append(f"--imgsize={width},{height}")
-        if supports.get("--colorscheme"):
-            cmd.append(f"--colorscheme={colorscheme}")
-        if supports.get("--projection"):
-            cmd.append(f"--projection={projection}")
-        if args.view_opts and supports.get("--view"):
-            cmd.append(f"--view={args.view_opts}")
-
-        cmd.extend(["-o", str(out_file), str(scad_file)])
-
-        print(f"  Capturing: {label}")
-        run(cmd, get_scad_env())
-        print(f"    -> {out_file}")
+        # --camera has been supported by every OpenSCAD this script
+        # targets, so the prebuilt argv element is appended unconditionally.
+        cmd = [*base, camera, "-o", str(out_file), str(render_input)]
+        cmds.append((label, out_file, cmd))
+
+    # Sliding window of Popen objects: up to `jobs` renders in flight,
+    # so the next OpenSCAD's startup overlaps the previous one's compute.
+    # Status lines are buffered and written once at the end: with many
+    # frames in flight, a per-line flush for every completion would
+    # serialize the renders on the tty.
+    msgs = []
+    try:
+        procs = []
+        idx = 0
+        while idx < len(cmds) or procs:
+            while len(procs) < jobs and idx < len(cmds):
+                label, out_file, cmd = cmds[idx]
+                _echo(cmd)
+                procs.append((subprocess.Popen(cmd, env=scad_env, close_fds=_CLOSE_FDS), label, out_file))
+                idx += 1
+            proc, label, out_file = procs.pop(0)
+            rc = proc.wait()
+            if rc != 0:
+                for p, _, _ in procs:
+                    p.terminate()
+                print(f"Render failed (exit {rc})")
+                sys.exit(rc)
+            msgs.append(f"  Captured: {label}")
+            msgs.append(f"    -> {out_file}")
+    finally:
+        if msgs:
+            print("\n".join(msgs))
+        if csg_path:
+            csg_path.unlink(missing_ok=True)
 
     print()
     print("Screenshots complete!")
@@ -324,6 +768,8 @@ def main() -> int:
         description="OpenSCAD helper: validate, render STL, and take screenshots"
     )
     parser.add_argument("--openscad", help="Path to OpenSCAD binary")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Suppress command echo (also via SCAD_QUIET env var)")
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -339,6 +785,8 @@ def main() -> int:
     p_stl.add_argument("--in", dest="input", required=True, help="Input .scad file")
     p_stl.add_argument("--out", dest="output", help="Output .stl path")
     p_stl.add_argument("-D", "--define", action="append", default=[], help="Define variable")
+    p_stl.add_argument("--exec", action="store_true",
+                       help="Replace this process with OpenSCAD (skips STL cache and size report)")
 
     # screenshots subcommand
     p_shots = subparsers.add_parser("screenshots", help="Render PNG screenshots")
@@ -362,16 +810,22 @@ def main() -> int:
     p_shots.add_argument("--projection", choices=["o", "p"], help="o=orthographic, p=perspective")
     p_shots.add_argument("--colorscheme", help="Color scheme (default: Cornfield)")
     p_shots.add_argument("--view-opts", help="View options: axes,crosshairs,edges,scales")
+    p_shots.add_argument("--jobs", type=int, default=os.cpu_count(),
+                         help="Parallel render processes (default: CPU count)")
 
     args = parser.parse_args()
 
+    if args.quiet:
+        global QUIET
+        QUIET = True
+        os.environ["SCAD_QUIET"] = "1"  # propagate to nested invocations
+
     openscad = args.openscad or find_openscad()
     if not openscad:
         print("OpenSCAD not found. Install OpenSCAD.app or set OPENSCAD_BIN.")
         return 1
 
-    help_text = load_help_text(openscad)
-    supports = detect_flags(help_text)
+    supports = _load_supports_cached(openscad)
 
     if args.command == "validate":
         cmd_validate(args, openscad, supports)